@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+    Test Configuration
+    ------------------
+
+    `notify_slack.py` reads its configuration at import time, so the
+    environment must be populated before the test modules are collected
+
+"""
+
+import os
+
+os.environ.setdefault("SLACK_CHANNEL", "slack_testing_sandbox")
+os.environ.setdefault("SLACK_USERNAME", "notify_slack_test")
+os.environ.setdefault("SLACK_EMOJI", ":aws:")
+os.environ.setdefault("SLACK_WEBHOOK_URL", "https://hooks.slack.com/services/YOUR/WEBOOK/URL")
@@ -7,31 +7,69 @@
 
 """
 
-import base64
 import json
 import logging
 import os
 import re
-import urllib.parse
-import urllib.request
-from enum import Enum
-from typing import Any, Dict, Optional, Union, cast
-from urllib.error import HTTPError
+from base64 import b64decode
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union, cast
+from urllib.parse import quote
 
-import boto3
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 # Set default region if not provided
 REGION = os.environ.get("AWS_REGION", "us-east-1")
 
-# Create client so its cached/frozen between invocations
-KMS_CLIENT = boto3.client("kms", region_name=REGION)
+# KMS client is created on first use, so plaintext webhook URLs never pay for importing boto3
+KMS_CLIENT: Optional[Any] = None
+
+# Prefer orjson for (de)serialization when it is packaged with the function
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Maximum number of notifications sent to Slack concurrently for a batch of records
+MAX_CONCURRENT_NOTIFICATIONS = 8
+
+# Keep the connection pool and workers around so warm invocations reuse the TLS sessions to Slack
+HTTP = urllib3.PoolManager(
+    maxsize=MAX_CONCURRENT_NOTIFICATIONS,
+    retries=urllib3.Retry(3, backoff_factor=0.1),
+)
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_NOTIFICATIONS)
+
 
+# AWS services supported by function
+SUPPORTED_SERVICES = frozenset(("cloudwatch", "guardduty"))
 
-class AwsService(Enum):
-    """AWS service supported by function"""
 
-    cloudwatch = "cloudwatch"
-    guardduty = "guardduty"
+def get_kms_client() -> Any:
+    """Get the KMS client, creating it on first use
+
+    The client is cached/frozen between invocations
+
+    :returns: KMS client for the function region
+    """
+    global KMS_CLIENT
+
+    if KMS_CLIENT is None:
+        import boto3
+
+        KMS_CLIENT = boto3.client("kms", region_name=REGION)
+    return KMS_CLIENT
 
 
 def decrypt_url(encrypted_url: str) -> str:
@@ -41,8 +79,8 @@ def decrypt_url(encrypted_url: str) -> str:
     :returns: plaintext URL
     """
     try:
-        decrypted_payload = KMS_CLIENT.decrypt(
-            CiphertextBlob=base64.b64decode(encrypted_url)
+        decrypted_payload = get_kms_client().decrypt(
+            CiphertextBlob=b64decode(encrypted_url)
         )
         return decrypted_payload["Plaintext"].decode()
     except Exception:
@@ -50,6 +88,46 @@ def decrypt_url(encrypted_url: str) -> str:
         return ""
 
 
+# Read configuration once so warm invocations skip the environment lookups
+# and, for KMS encrypted webhook URLs, the decrypt round-trip
+SLACK_CHANNEL = os.environ["SLACK_CHANNEL"]
+SLACK_USERNAME = os.environ["SLACK_USERNAME"]
+SLACK_EMOJI = os.environ["SLACK_EMOJI"]
+
+SLACK_WEBHOOK_URL = os.environ["SLACK_WEBHOOK_URL"]
+SLACK_URL = (
+    SLACK_WEBHOOK_URL
+    if SLACK_WEBHOOK_URL.startswith("http")
+    else decrypt_url(SLACK_WEBHOOK_URL)
+)
+
+
+def get_slack_url() -> str:
+    """Get the plaintext Slack webhook URL
+
+    Retries decryption if it failed when the function was loaded, so a
+    transient KMS error does not disable the execution environment
+
+    :returns: plaintext URL
+    """
+    global SLACK_URL
+
+    if not SLACK_URL:
+        SLACK_URL = decrypt_url(SLACK_WEBHOOK_URL)
+    return SLACK_URL
+
+
+# Console URL templates keyed by (service, is GovCloud region), filled in with the region
+SERVICE_URLS = {
+    (service, is_govcloud): f"https://{console}/{service}/home?region={{}}"
+    for service in SUPPORTED_SERVICES
+    for is_govcloud, console in (
+        (False, "console.aws.amazon.com"),
+        (True, "console.amazonaws-us-gov.com"),
+    )
+}
+
+
 def get_service_url(region: str, service: str) -> str:
     """Get the appropriate service URL for the region
 
@@ -58,23 +136,28 @@ def get_service_url(region: str, service: str) -> str:
     :returns: AWS console url formatted for the region and service provided
     """
     try:
-        service_name = AwsService[service].value
-        if region.startswith("us-gov-"):
-            return f"https://console.amazonaws-us-gov.com/{service_name}/home?region={region}"
-        else:
-            return f"https://console.aws.amazon.com/{service_name}/home?region={region}"
+        return SERVICE_URLS[(service, region.startswith("us-gov-"))].format(region)
 
     except KeyError:
         print(f"Service {service} is currently not supported")
         raise
 
 
-class CloudWatchAlarmState(Enum):
-    """Maps CloudWatch notification state to Slack message format color"""
+# Maps CloudWatch notification state to Slack message format color
+CLOUDWATCH_ALARM_STATE_COLORS: Dict[str, str] = {
+    "OK": "good",
+    "INSUFFICIENT_DATA": "warning",
+    "ALARM": "danger",
+}
 
-    OK = "good"
-    INSUFFICIENT_DATA = "warning"
-    ALARM = "danger"
+# CloudWatch alarm fields shown verbatim, as (title, message key, short)
+CLOUDWATCH_ALARM_FIELDS = (
+    ("Alarm Name", "AlarmName", True),
+    ("Alarm Description", "AlarmDescription", False),
+    ("Alarm reason", "NewStateReason", False),
+    ("Old State", "OldStateValue", True),
+    ("Current State", "NewStateValue", True),
+)
 
 
 def format_cloudwatch_alarm(message: Dict[str, Any], region: str) -> Dict[str, Any]:
@@ -88,47 +171,31 @@ def format_cloudwatch_alarm(message: Dict[str, Any], region: str) -> Dict[str, A
     cloudwatch_url = get_service_url(region=region, service="cloudwatch")
     alarm_name = message["AlarmName"]
 
+    fields = [
+        {"title": title, "value": f"`{message[key]}`", "short": short}
+        for title, key, short in CLOUDWATCH_ALARM_FIELDS
+    ]
+    fields.append(
+        {
+            "title": "Link to Alarm",
+            "value": f"{cloudwatch_url}#alarm:alarmFilter=ANY;name={quote(alarm_name)}",
+            "short": False,
+        }
+    )
+
     return {
-        "color": CloudWatchAlarmState[message["NewStateValue"]].value,
+        "color": CLOUDWATCH_ALARM_STATE_COLORS[message["NewStateValue"]],
         "fallback": f"Alarm {alarm_name} triggered",
-        "fields": [
-            {"title": "Alarm Name", "value": f"`{alarm_name}`", "short": True},
-            {
-                "title": "Alarm Description",
-                "value": f"`{message['AlarmDescription']}`",
-                "short": False,
-            },
-            {
-                "title": "Alarm reason",
-                "value": f"`{message['NewStateReason']}`",
-                "short": False,
-            },
-            {
-                "title": "Old State",
-                "value": f"`{message['OldStateValue']}`",
-                "short": True,
-            },
-            {
-                "title": "Current State",
-                "value": f"`{message['NewStateValue']}`",
-                "short": True,
-            },
-            {
-                "title": "Link to Alarm",
-                "value": f"{cloudwatch_url}#alarm:alarmFilter=ANY;name={urllib.parse.quote(alarm_name)}",
-                "short": False,
-            },
-        ],
+        "fields": fields,
         "text": f"AWS CloudWatch notification - {message['AlarmName']}",
     }
 
 
-class GuardDutyFindingSeverity(Enum):
-    """Maps GuardDuty finding severity to Slack message format color"""
-
-    Low = "#777777"
-    Medium = "warning"
-    High = "danger"
+# GuardDuty finding severity buckets; a score below the first threshold is Low,
+# below the second is Medium, and anything else is High
+GUARDDUTY_FINDING_SEVERITY_THRESHOLDS = (4.0, 7.0)
+GUARDDUTY_FINDING_SEVERITIES = ("Low", "Medium", "High")
+GUARDDUTY_FINDING_SEVERITY_COLORS = ("#777777", "warning", "danger")
 
 
 def format_guardduty_finding(message: Dict[str, Any], region: str) -> Dict[str, Any]:
@@ -145,15 +212,11 @@ def format_guardduty_finding(message: Dict[str, Any], region: str) -> Dict[str,
     service = detail.get("service", {})
     severity_score = detail.get("severity")
 
-    if severity_score < 4.0:
-        severity = "Low"
-    elif severity_score < 7.0:
-        severity = "Medium"
-    else:
-        severity = "High"
+    bucket = bisect_right(GUARDDUTY_FINDING_SEVERITY_THRESHOLDS, severity_score)
+    severity = GUARDDUTY_FINDING_SEVERITIES[bucket]
 
     return {
-        "color": GuardDutyFindingSeverity[severity].value,
+        "color": GUARDDUTY_FINDING_SEVERITY_COLORS[bucket],
         "fallback": f"GuardDuty Finding: {detail.get('title')}",
         "fields": [
             {
@@ -193,17 +256,16 @@ def format_guardduty_finding(message: Dict[str, Any], region: str) -> Dict[str,
     }
 
 
-class AwsHealthCategory(Enum):
-    """Maps AWS Health eventTypeCategory to Slack message format color
-
-    eventTypeCategory
-        The category code of the event. The possible values are issue,
-        accountNotification, and scheduledChange.
-    """
-
-    accountNotification = "#777777"
-    scheduledChange = "warning"
-    issue = "danger"
+# Maps AWS Health eventTypeCategory to Slack message format color
+#
+# eventTypeCategory
+#     The category code of the event. The possible values are issue,
+#     accountNotification, and scheduledChange.
+AWS_HEALTH_CATEGORY_COLORS: Dict[str, str] = {
+    "accountNotification": "#777777",
+    "scheduledChange": "warning",
+    "issue": "danger",
+}
 
 
 def format_aws_health(message: Dict[str, Any], region: str) -> Dict[str, Any]:
@@ -223,7 +285,7 @@ def format_aws_health(message: Dict[str, Any], region: str) -> Dict[str, Any]:
     service = detail.get("service", "<unknown>")
 
     return {
-        "color": AwsHealthCategory[detail["eventTypeCategory"]].value,
+        "color": AWS_HEALTH_CATEGORY_COLORS[detail["eventTypeCategory"]],
         "text": f"New AWS Health Event for {service}",
         "fallback": f"New AWS Health Event for {service}",
         "fields": [
@@ -267,6 +329,21 @@ def format_aws_health(message: Dict[str, Any], region: str) -> Dict[str, Any]:
     }
 
 
+# Maps the named groups of AWS_BACKUP_FIELD_REGEX to field titles, in display order
+AWS_BACKUP_FIELDS: Dict[str, str] = {
+    "backup_job_id": "BackupJob ID",
+    "resource_arn": "Resource ARN",
+    "recovery_point_arn": "Recovery point ARN",
+}
+
+# ARNs may contain periods, so values run up to the period that ends the sentence
+AWS_BACKUP_FIELD_REGEX = re.compile(
+    r"BackupJob ID : (?P<backup_job_id>\S+)"
+    r"|Resource ARN : (?P<resource_arn>\S+?)\.(?=\s|$)"
+    r"|Recovery point ARN: (?P<recovery_point_arn>\S+?)\.(?=\s|$)"
+)
+
+
 def aws_backup_field_parser(message: str) -> Dict[str, str]:
     """
     Parser for AWS Backup event message. It extracts the fields from the message and returns a dictionary.
@@ -274,25 +351,17 @@ def aws_backup_field_parser(message: str) -> Dict[str, str]:
     :params message: message containing AWS Backup event
     :returns: dictionary containing the fields extracted from the message
     """
-    # Order is somewhat important, working in reverse order of the message payload
-    # to reduce right most matched values
-    field_names = {
-        "BackupJob ID": r"(BackupJob ID : ).*",
-        "Resource ARN": r"(Resource ARN : ).*[.]",
-        "Recovery point ARN": r"(Recovery point ARN: ).*[.]",
-    }
-    fields = {}
-
-    for fname, freg in field_names.items():
-        match = re.search(freg, message)
-        if match:
-            value = match.group(0).split(" ")[-1]
-            fields[fname] = value.removesuffix(".")
+    matches: Dict[str, str] = {}
 
-            # Remove the matched field from the message
-            message = message.replace(match.group(0), "")
+    for match in AWS_BACKUP_FIELD_REGEX.finditer(message):
+        group = cast(str, match.lastgroup)
+        matches.setdefault(group, match.group(group))
 
-    return fields
+    return {
+        fname: matches[group].removesuffix(".")
+        for group, fname in AWS_BACKUP_FIELDS.items()
+        if group in matches
+    }
 
 
 def format_aws_backup(message: str) -> Dict[str, Any]:
@@ -326,34 +395,35 @@ def format_aws_backup(message: str) -> Dict[str, Any]:
 
     return attachments
 
-class S3ObjectNotificationCategory(Enum):
-    """Maps S3 Object notification Cateogry to Slack message format color
-        https://docs.aws.amazon.com/AmazonS3/latest/userguide/notification-content-structure.html
-        https://docs.aws.amazon.com/AmazonS3/latest/userguide/notification-how-to-event-types-and-destinations.html
-    """
 
-    TestEvent = "good"
-    ObjectCreated_Put = "good"
-    ObjectCreated_Post = "good"
-    ObjectCreated_Copy = "good"
-    ObjectCreated_CompleteMultipartUpload = "good"
-    ObjectRemoved_Delete = "danger"
-    ObjectRemoved_DeleteMarkerCreated = "danger"
-    ObjectRestore_Post = "good"
-    ObjectRestore_Completed = "good"
-    ObjectRestore_Delete = "danger"
-    ReducedRedundancyLostObject = "danger"
-    Replication_OperationFailedReplication = "danger"
-    Replication_OperationMissedThreshold = "danger"
-    Replication_OperationReplicatedAfterThreshold = "warning"
-    Replication_OperationNotTracked = "danger"
-    LifecycleExpiration_Delete = "danger"
-    LifecycleExpiration_DeleteMarkerCreated = "danger"
-    LifecycleTransition = "warning"
-    IntelligentTiering = "warning"
-    ObjectTagging_Put = "warning"
-    ObjectTagging_Delete = "warning"
-    ObjectAcl_Put = "warning"
+# Maps S3 Object notification event name to Slack message format color
+#     https://docs.aws.amazon.com/AmazonS3/latest/userguide/notification-content-structure.html
+#     https://docs.aws.amazon.com/AmazonS3/latest/userguide/notification-how-to-event-types-and-destinations.html
+S3_OBJECT_NOTIFICATION_CATEGORY_COLORS: Dict[str, str] = {
+    "TestEvent": "good",
+    "ObjectCreated:Put": "good",
+    "ObjectCreated:Post": "good",
+    "ObjectCreated:Copy": "good",
+    "ObjectCreated:CompleteMultipartUpload": "good",
+    "ObjectRemoved:Delete": "danger",
+    "ObjectRemoved:DeleteMarkerCreated": "danger",
+    "ObjectRestore:Post": "good",
+    "ObjectRestore:Completed": "good",
+    "ObjectRestore:Delete": "danger",
+    "ReducedRedundancyLostObject": "danger",
+    "Replication:OperationFailedReplication": "danger",
+    "Replication:OperationMissedThreshold": "danger",
+    "Replication:OperationReplicatedAfterThreshold": "warning",
+    "Replication:OperationNotTracked": "danger",
+    "LifecycleExpiration:Delete": "danger",
+    "LifecycleExpiration:DeleteMarkerCreated": "danger",
+    "LifecycleTransition": "warning",
+    "IntelligentTiering": "warning",
+    "ObjectTagging:Put": "warning",
+    "ObjectTagging:Delete": "warning",
+    "ObjectAcl:Put": "warning",
+}
+
 
 def format_s3_object_notification(message: Dict[str, Any]) -> Dict[str, Any]:
     """Format S3 Object notification event into Slack message format
@@ -363,68 +433,96 @@ def format_s3_object_notification(message: Dict[str, Any]) -> Dict[str, Any]:
     :returns: formatted Slack message payload
     """
     record = message["Records"][0]
+    s3 = record["s3"]
+    s3_object = s3["object"]
     event_name = record["eventName"]
     event_time = record["eventTime"]
-    bucket_name = record["s3"]["bucket"]["name"]
+    bucket_name = s3["bucket"]["name"]
     region = record["awsRegion"]
-    object_key = record["s3"]["object"]["key"]
+    object_key = s3_object["key"]
     object_url = f"https://s3.console.aws.amazon.com/s3/object/{bucket_name}?region={region}&prefix={object_key}"
     source_ip_address = record["requestParameters"]["sourceIPAddress"]
     user_identity = record["userIdentity"]["principalId"].split(":")[-1]
 
-    output = {
-        "color": S3ObjectNotificationCategory[record["eventName"].replace(":", "_")].value,
+    fields = [
+        {"title": "Event Name", "value": f"`{event_name}`", "short": True},
+        {"title": "Event Time", "value": f"`{event_time}`", "short": True},
+        {"title": "Region", "value": f"`{region}`", "short": True},
+        {"title": "Bucket Name", "value": f"`{bucket_name}`", "short": True},
+        {"title": "Object Key", "value": f"`{object_key}`", "short": False},
+        {"title": "Object URL", "value": f"<{object_url}|Link>", "short": False},
+        {"title": "Source IP Address", "value": f"`{source_ip_address}`", "short": True},
+        {"title": "User Identity", "value": f"`{user_identity}`", "short": True},
+    ]
+
+    if (object_size := s3_object.get("size")) is not None:
+        fields += [{"title": "Object Size (Bytes)", "value": f"`{object_size}`", "short": False}]
+
+    if glacier_event_data := record.get("glacierEventData"):
+        glacier_restore_event_data = glacier_event_data["restoreEventData"]
+        lifecycle_restoration_expiry_time = glacier_restore_event_data["lifecycleRestorationExpiryTime"]
+        lifecycle_restore_storage_class = glacier_restore_event_data["lifecycleRestoreStorageClass"]
+        fields += [
+            {
+                "title": "Lifecycle Restoration Expiry Time",
+                "value": f"`{lifecycle_restoration_expiry_time}`",
+                "short": False,
+            },
+            {
+                "title": "Lifecycle Restore Storage Class",
+                "value": f"`{lifecycle_restore_storage_class}`",
+                "short": False,
+            },
+        ]
+
+    if replication_event_data := record.get("replicationEventData"):
+        replication_rule_name = replication_event_data["replicationRuleId"]
+        destination_bucket = replication_event_data["destinationBucket"].split(":")[-1]
+        request_time = replication_event_data["requestTime"]
+        operation = replication_event_data["s3Operation"]
+        failure_reason = replication_event_data["failureReason"]
+        fields += [
+            {"title": "Replication Rule Name", "value": f"`{replication_rule_name}`", "short": True},
+            {"title": "Destination Bucket", "value": f"`{destination_bucket}`", "short": True},
+            {"title": "Request Time", "value": f"`{request_time}`", "short": False},
+            {"title": "Operation", "value": f"`{operation}`", "short": True},
+            {"title": "Failure Reason", "value": f"`{failure_reason}`", "short": False},
+        ]
+
+    if intelligent_tiering_event_data := record.get("intelligentTieringEventData"):
+        tiering_name = intelligent_tiering_event_data["tieringId"]
+        tiering_status = intelligent_tiering_event_data["tieringStatus"]
+        fields += [
+            {"title": "Tiering Name", "value": f"`{tiering_name}`", "short": True},
+            {"title": "Tiering Status", "value": f"`{tiering_status}`", "short": True},
+        ]
+
+    if lifecycle_event_data := record.get("lifecycleEventData"):
+        lifecycle_transition_days = lifecycle_event_data["lifecycleTransitionAgeDays"]
+        lifecycle_transition_storage_class = lifecycle_event_data["lifecycleTransitionStorageClass"]
+        fields += [
+            {"title": "Lifecycle Transition Age Days", "value": f"`{lifecycle_transition_days}`", "short": True},
+            {
+                "title": "Lifecycle Transition Storage Class",
+                "value": f"`{lifecycle_transition_storage_class}`",
+                "short": True,
+            },
+        ]
+
+    return {
+        "color": S3_OBJECT_NOTIFICATION_CATEGORY_COLORS[event_name],
         "fallback": f"Alarm {event_name} triggered",
-        "fields": [
-            {"title": "Event Name", "value": f"`{event_name}`", "short": True},
-            {"title": "Event Time", "value": f"`{event_time}`", "short": True},
-            {"title": "Region", "value": f"`{region}`", "short": True},
-            {"title": "Bucket Name", "value": f"`{bucket_name}`", "short": True},
-            {"title": "Object Key", "value": f"`{object_key}`", "short": False},
-
-            {"title": "Object URL", "value": f"<{object_url}|Link>", "short": False},
-            {"title": "Source IP Address", "value": f"`{source_ip_address}`", "short": True},
-            {"title": "User Identity", "value": f"`{user_identity}`", "short": True},
-        ],
-        "text": f"*New Amazon S3 Object Notification Event*",
+        "fields": fields,
+        "text": "*New Amazon S3 Object Notification Event*",
     }
 
-    if "size" in record["s3"]["object"]:
-        object_size = record["s3"]["object"]["size"]
-        output["fields"].append({"title": "Object Size (Bytes)", "value": f"`{object_size}`", "short": False})
 
-    if "glacierEventData" in record:
-        glacier_restore_event_data = record["glacierEventData"]["restoreEventData"]["lifecycleRestorationExpiryTime"]
-        lifecycle_restoration_expiry_time = glacier_restore_event_data["lifecycleRestorationExpiryTime"]
-        lifecycle_restore_storage_class = glacier_restore_event_data["lifecycleRestoreStorageClass"]
-        output["fields"].append({"title": "Lifecycle Restoration Expiry Time", "value": f"`{lifecycle_restoration_expiry_time}`", "short": False})
-        output["fields"].append({"title": "Lifecycle Restore Storage Class", "value": f"`{lifecycle_restore_storage_class}`", "short": False})
-
-    if "replicationEventData" in record:
-        replication_rule_name = record["replicationEventData"]["replicationRuleId"]
-        destination_bucket = record["replicationEventData"]["destinationBucket"].split(":")[-1]
-        request_time = record["replicationEventData"]["requestTime"]
-        operation = record["replicationEventData"]["s3Operation"]
-        failureReason = record["replicationEventData"]["failureReason"]
-        output["fields"].append({"title": "Replication Rule Name", "value": f"`{replication_rule_name}`", "short": True})
-        output["fields"].append({"title": "Destination Bucket", "value": f"`{destination_bucket}`", "short": True})
-        output["fields"].append({"title": "Request Time", "value": f"`{request_time}`", "short": False})
-        output["fields"].append({"title": "Operation", "value": f"`{operation}`", "short": True})
-        output["fields"].append({"title": "Failure Reason", "value": f"`{failureReason}`", "short": False})
-
-    if "intelligentTieringEventData" in record:
-        tiering_name = record["intelligentTieringEventData"]["tieringId"]
-        tiering_status = record["intelligentTieringEventData"]["tieringStatus"]
-        output["fields"].append({"title": "Tiering Name", "value": f"`{tiering_name}`", "short": True})
-        output["fields"].append({"title": "Tiering Status", "value": f"`{tiering_status}`", "short": True})
-
-    if "lifecycleEventData" in record:
-        lifecycle_transition_days = record["lifecycleEventData"]["lifecycleTransitionAgeDays"]
-        lifecycle_transition_storage_class = record["lifecycleEventData"]["lifecycleTransitionStorageClass"]
-        output["fields"].append({"title": "Lifecycle Transition Age Days", "value": f"`{lifecycle_transition_days}`", "short": True})
-        output["fields"].append({"title": "Lifecycle Transition Storage Class", "value": f"`{lifecycle_transition_storage_class}`", "short": True})
-
-    return output
+# Values rendered as JSON by the default formatter
+CONTAINER_TYPES = (dict, list)
+
+# Values shorter than this are displayed side by side by the default formatter
+SHORT_FIELD_MAX_LENGTH = 25
+
 
 def format_default(
     message: Union[str, Dict], subject: Optional[str] = None
@@ -442,14 +540,15 @@ def format_default(
         "title": subject if subject else "Message",
         "mrkdwn_in": ["value"],
     }
-    fields = []
 
-    if type(message) is dict:
-        for k, v in message.items():
-            value = f"{json.dumps(v)}" if isinstance(v, (dict, list)) else str(v)
-            fields.append({"title": k, "value": f"`{value}`", "short": len(value) < 25})
+    if isinstance(message, dict):
+        fields = [
+            {"title": k, "value": f"`{value}`", "short": len(value) < SHORT_FIELD_MAX_LENGTH}
+            for k, v in message.items()
+            for value in [json.dumps(v) if isinstance(v, CONTAINER_TYPES) else str(v)]
+        ]
     else:
-        fields.append({"value": message, "short": False})
+        fields = [{"value": message, "short": False}]
 
     if fields:
         attachments["fields"] = fields  # type: ignore
@@ -457,6 +556,29 @@ def format_default(
     return attachments
 
 
+def load_message(message: Union[str, Dict]) -> Union[str, Dict]:
+    """
+    Load structured (JSON) notification message, leaving plain text as is
+
+    :params message: SNS message body notification payload
+    :returns: parsed message if structured, otherwise the message provided
+    """
+    if isinstance(message, str):
+        try:
+            return json_loads(message)
+        except json.JSONDecodeError:
+            logging.info("Not a structured payload, just a string message")
+
+    return message
+
+
+# Formatters for EventBridge events, keyed by the event detail-type
+DETAIL_TYPE_FORMATTERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "GuardDuty Finding": format_guardduty_finding,
+    "AWS Health Event": format_aws_health,
+}
+
+
 def get_slack_message_payload(
     message: Union[str, Dict], region: str, subject: Optional[str] = None
 ) -> Dict:
@@ -469,49 +591,31 @@ def get_slack_message_payload(
     :returns: Slack message payload
     """
 
-    slack_channel = os.environ["SLACK_CHANNEL"]
-    slack_username = os.environ["SLACK_USERNAME"]
-    slack_emoji = os.environ["SLACK_EMOJI"]
-
     payload = {
-        "channel": slack_channel,
-        "username": slack_username,
-        "icon_emoji": slack_emoji,
+        "channel": SLACK_CHANNEL,
+        "username": SLACK_USERNAME,
+        "icon_emoji": SLACK_EMOJI,
     }
     attachment = None
 
-    if isinstance(message, str):
-        try:
-            message = json.loads(message)
-        except json.JSONDecodeError:
-            logging.info("Not a structured payload, just a string message")
+    # AWS Backup notifications are plain text, format them as delivered
+    if subject == "Notification from AWS Backup" and isinstance(message, str):
+        payload["attachments"] = [format_aws_backup(message=message)]  # type: ignore
+        return payload
 
-    message = cast(Dict[str, Any], message)
-
-    if "AlarmName" in message:
-        notification = format_cloudwatch_alarm(message=message, region=region)
-        attachment = notification
-
-    elif (
-        isinstance(message, Dict) and message.get("detail-type") == "GuardDuty Finding"
-    ):
-        notification = format_guardduty_finding(
-            message=message, region=message["region"]
-        )
-        attachment = notification
+    message = load_message(message)
 
-    elif isinstance(message, Dict) and message.get("detail-type") == "AWS Health Event":
-        notification = format_aws_health(message=message, region=message["region"])
-        attachment = notification
+    if not isinstance(message, dict):
+        attachment = format_default(message=message, subject=subject)
 
-    elif subject == "Notification from AWS Backup":
-        notification = format_aws_backup(message=str(message))
-        attachment = notification
+    elif "AlarmName" in message:
+        attachment = format_cloudwatch_alarm(message=message, region=region)
 
+    elif formatter := DETAIL_TYPE_FORMATTERS.get(message.get("detail-type", "")):
+        attachment = formatter(message=message, region=message["region"])
 
-    elif isinstance(message, Dict) and message.get("Records")[0].get("eventSource") == "aws:s3":
-        notification = format_s3_object_notification(message=message)
-        attachment = notification
+    elif (records := message.get("Records")) and records[0].get("eventSource") == "aws:s3":
+        attachment = format_s3_object_notification(message=message)
 
     elif "attachments" in message or "text" in message:
         payload = {**payload, **message}
@@ -525,7 +629,7 @@ def get_slack_message_payload(
     return payload
 
 
-def send_slack_notification(payload: Dict[str, Any]) -> str:
+def send_slack_notification(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Send notification payload to Slack
 
@@ -533,33 +637,32 @@ def send_slack_notification(payload: Dict[str, Any]) -> str:
     :returns: response details from sending notification
     """
 
-    slack_url = os.environ["SLACK_WEBHOOK_URL"]
-    if not slack_url.startswith("http"):
-        slack_url = decrypt_url(slack_url)
-
-    data = urllib.parse.urlencode({"payload": json.dumps(payload)}).encode("utf-8")
-    req = urllib.request.Request(slack_url)
+    result = HTTP.request(
+        "POST",
+        get_slack_url(),
+        body=json_dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
+    info = "".join(f"{k}: {v}\n" for k, v in result.headers.items())
 
-    try:
-        result = urllib.request.urlopen(req, data)
-        return json.dumps({"code": result.getcode(), "info": result.info().as_string()})
+    if result.status != 200:
+        logging.error(f"HTTP Error {result.status}: {result.data.decode()}")
 
-    except HTTPError as e:
-        logging.error(f"{e}: result")
-        return json.dumps({"code": e.getcode(), "info": e.info().as_string()})
+    return {"code": result.status, "info": info}
 
 
-def lambda_handler(event: Dict[str, Any], context: Dict[str, Any]) -> str:
+def lambda_handler(event: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Lambda function to parse notification events and forward to Slack
 
     :param event: lambda expected event object
     :param context: lambda expected context object
-    :returns: none
+    :returns: response details from sending the last notification
     """
     if os.environ.get("LOG_EVENTS", "False") == "True":
         logging.info(f"Event logging enabled: `{json.dumps(event)}`")
 
+    payloads = []
     for record in event["Records"]:
         try:
             sns = record["Sns"]
@@ -569,17 +672,21 @@ def lambda_handler(event: Dict[str, Any], context: Dict[str, Any]) -> str:
         except KeyError:
             region = record["awsRegion"]
             subject = "New Amazon S3 Object Event Notification"
-            message = record
+            message = {"Records": [record]}
 
         payload = get_slack_message_payload(
             message=message, region=region, subject=subject
         )
-        response = send_slack_notification(payload=payload)
+        payloads.append(payload)
 
-    if json.loads(response)["code"] != 200:
-        response_info = json.loads(response)["info"]
-        logging.error(
-            f"Error: received status `{response_info}` using event `{event}` and context `{context}`"
-        )
+    # Each webhook call is independent and I/O bound, so send them concurrently
+    responses = list(EXECUTOR.map(send_slack_notification, payloads))
+
+    for record, response in zip(event["Records"], responses):
+        if response["code"] != 200:
+            response_info = response["info"]
+            logging.error(
+                f"Error: received status `{response_info}` using record `{record}` and context `{context}`"
+            )
 
-    return response
+    return responses[-1]
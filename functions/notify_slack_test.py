@@ -8,6 +8,7 @@
 """
 
 import ast
+import importlib
 import os
 
 import notify_slack
@@ -21,9 +22,9 @@ def test_sns_get_slack_message_payload_snapshots(snapshot, monkeypatch):
     Run `pipenv run test:updatesnapshots` to update snapshot images
     """
 
-    monkeypatch.setenv("SLACK_CHANNEL", "slack_testing_sandbox")
-    monkeypatch.setenv("SLACK_USERNAME", "notify_slack_test")
-    monkeypatch.setenv("SLACK_EMOJI", ":aws:")
+    monkeypatch.setattr(notify_slack, "SLACK_CHANNEL", "slack_testing_sandbox")
+    monkeypatch.setattr(notify_slack, "SLACK_USERNAME", "notify_slack_test")
+    monkeypatch.setattr(notify_slack, "SLACK_EMOJI", ":aws:")
 
     # These are SNS messages that invoke the lambda handler; the event payload is in the
     # `message` field
@@ -37,10 +38,16 @@ def test_sns_get_slack_message_payload_snapshots(snapshot, monkeypatch):
             attachments = []
             # These are as delivered wrapped in an SNS message payload so we unpack
             for record in event["Records"]:
-                sns = record["Sns"]
-                subject = sns["Subject"]
-                message = sns["Message"]
-                region = sns["TopicArn"].split(":")[3]
+                try:
+                    sns = record["Sns"]
+                    subject = sns["Subject"]
+                    message = sns["Message"]
+                    region = sns["TopicArn"].split(":")[3]
+                except KeyError:
+                    # S3 event notifications are delivered directly, not through SNS
+                    region = record["awsRegion"]
+                    subject = "New Amazon S3 Object Event Notification"
+                    message = {"Records": [record]}
 
                 attachment = notify_slack.get_slack_message_payload(
                     message=message, region=region, subject=subject
@@ -58,9 +65,9 @@ def test_event_get_slack_message_payload_snapshots(snapshot, monkeypatch):
     Run `pipenv run test:updatesnapshots` to update snapshot images
     """
 
-    monkeypatch.setenv("SLACK_CHANNEL", "slack_testing_sandbox")
-    monkeypatch.setenv("SLACK_USERNAME", "notify_slack_test")
-    monkeypatch.setenv("SLACK_EMOJI", ":aws:")
+    monkeypatch.setattr(notify_slack, "SLACK_CHANNEL", "slack_testing_sandbox")
+    monkeypatch.setattr(notify_slack, "SLACK_USERNAME", "notify_slack_test")
+    monkeypatch.setattr(notify_slack, "SLACK_EMOJI", ":aws:")
 
     # These are just the raw events that will be converted to JSON string and
     # sent via SNS message
@@ -82,7 +89,7 @@ def test_event_get_slack_message_payload_snapshots(snapshot, monkeypatch):
 
 def test_environment_variables_set(monkeypatch):
     """
-    Should pass since environment variables are provided
+    Should pass since environment variables are provided and read on import
     """
 
     monkeypatch.setenv("SLACK_CHANNEL", "slack_testing_sandbox")
@@ -92,6 +99,16 @@ def test_environment_variables_set(monkeypatch):
         "SLACK_WEBHOOK_URL", "https://hooks.slack.com/services/YOUR/WEBOOK/URL"
     )
 
+    importlib.reload(notify_slack)
+
+    assert notify_slack.SLACK_CHANNEL == "slack_testing_sandbox"
+    assert notify_slack.SLACK_USERNAME == "notify_slack_test"
+    assert notify_slack.SLACK_EMOJI == ":aws:"
+    assert (
+        notify_slack.SLACK_URL == "https://hooks.slack.com/services/YOUR/WEBOOK/URL"
+    )
+    assert notify_slack.KMS_CLIENT is None
+
     with open(os.path.join("./messages/text_message.json"), "r") as efile:
         event = ast.literal_eval(efile.read())
 
@@ -106,14 +123,19 @@ def test_environment_variables_set(monkeypatch):
             )
 
 
-def test_environment_variables_missing():
+def test_environment_variables_missing(monkeypatch):
     """
     Should pass since environment variables are NOT provided and
-    will raise a `KeyError`
+    will raise a `KeyError` when the module is loaded
     """
-    with pytest.raises(KeyError):
-        # will raise before parsing/validation
-        notify_slack.get_slack_message_payload(message={}, region="foo", subject="bar")
+    monkeypatch.delenv("SLACK_CHANNEL")
+
+    try:
+        with pytest.raises(KeyError):
+            importlib.reload(notify_slack)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(notify_slack)
 
 
 @pytest.mark.parametrize(
@@ -147,7 +169,95 @@ def test_get_service_url(region, service, expected):
 
 def test_get_service_url_exception():
     """
-    Should raise error since service is not defined in enum
+    Should raise error since service is not supported
     """
     with pytest.raises(KeyError):
         notify_slack.get_service_url(region="us-east-1", service="athena")
+
+
+@pytest.mark.parametrize(
+    "severity_score,severity,color",
+    [
+        (1.0, "Low", "#777777"),
+        (4.0, "Medium", "warning"),
+        (6.9, "Medium", "warning"),
+        (7.0, "High", "danger"),
+        (8.9, "High", "danger"),
+    ],
+)
+def test_format_guardduty_finding_severity(severity_score, severity, color):
+    with open(os.path.join("./events/guardduty_finding_high.json"), "r") as efile:
+        event = ast.literal_eval(efile.read())
+    event["detail"]["severity"] = severity_score
+
+    attachment = notify_slack.format_guardduty_finding(
+        message=event, region=event["region"]
+    )
+
+    assert attachment["color"] == color
+    assert {"title": "Severity", "value": f"`{severity}`", "short": True} in attachment[
+        "fields"
+    ]
+
+
+def test_lambda_handler_logs_each_failed_record(monkeypatch, caplog):
+    """
+    Should log a delivery failure for every record, not only the last one
+    """
+    codes = iter([500, 200, 200])
+
+    def send_slack_notification(payload):
+        return {"code": next(codes), "info": "status"}
+
+    monkeypatch.setattr(notify_slack, "send_slack_notification", send_slack_notification)
+
+    with open(os.path.join("./messages/backup.json"), "r") as efile:
+        event = ast.literal_eval(efile.read())
+
+    response = notify_slack.lambda_handler(event=event, context={})
+
+    assert response["code"] == 200
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+
+
+def test_format_s3_object_notification_glacier_restore():
+    """
+    Should report the restore expiry time and storage class of a restored object
+    """
+    with open(os.path.join("./events/s3_object_creation_notification.json"), "r") as efile:
+        event = ast.literal_eval(efile.read())
+    event["Records"][0]["eventName"] = "ObjectRestore:Completed"
+    event["Records"][0]["glacierEventData"] = {
+        "restoreEventData": {
+            "lifecycleRestorationExpiryTime": "2024-12-19T00:00:00.000Z",
+            "lifecycleRestoreStorageClass": "GLACIER",
+        }
+    }
+
+    attachment = notify_slack.format_s3_object_notification(message=event)
+
+    assert attachment["fields"][-2:] == [
+        {
+            "title": "Lifecycle Restoration Expiry Time",
+            "value": "`2024-12-19T00:00:00.000Z`",
+            "short": False,
+        },
+        {
+            "title": "Lifecycle Restore Storage Class",
+            "value": "`GLACIER`",
+            "short": False,
+        },
+    ]
+
+
+def test_get_slack_url_retries_failed_decryption(monkeypatch):
+    """
+    Should decrypt the webhook URL again when decryption failed on load
+    """
+    monkeypatch.setattr(notify_slack, "SLACK_URL", "")
+    monkeypatch.setattr(
+        notify_slack, "decrypt_url", lambda encrypted_url: "https://hooks.slack.com/services/YOUR/WEBOOK/URL"
+    )
+
+    assert notify_slack.get_slack_url() == "https://hooks.slack.com/services/YOUR/WEBOOK/URL"
+    assert notify_slack.SLACK_URL == "https://hooks.slack.com/services/YOUR/WEBOOK/URL"
@@ -282,6 +282,383 @@ snapshots['test_event_get_slack_message_payload_snapshots event_guardduty_findin
     }
 ]
 
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_acl_put_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'warning',
+                'fallback': 'Alarm ObjectAcl:Put triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectAcl:Put`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-13T21:24:59.306Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_creation_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'good',
+                'fallback': 'Alarm ObjectCreated:CompleteMultipartUpload triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectCreated:CompleteMultipartUpload`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T14:44:56.042Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Size (Bytes)',
+                        'value': '`557056`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_delete_marker_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'danger',
+                'fallback': 'Alarm ObjectRemoved:DeleteMarkerCreated triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectRemoved:DeleteMarkerCreated`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T15:43:47.889Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_put_tag_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'warning',
+                'fallback': 'Alarm ObjectTagging:Put triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectTagging:Put`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T16:57:37.808Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_removal_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'danger',
+                'fallback': 'Alarm ObjectRemoved:Delete triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectRemoved:Delete`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T17:04:47.117Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
+snapshots['test_event_get_slack_message_payload_snapshots event_s3_object_replication_failure.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'danger',
+                'fallback': 'Alarm Replication:OperationFailedReplication triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`Replication:OperationFailedReplication`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T17:04:56.129Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`s3.amazonaws.com`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`s3.amazonaws.com`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Size (Bytes)',
+                        'value': '`1024`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Replication Rule Name',
+                        'value': '`Replication`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Destination Bucket',
+                        'value': '`test-replica`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Request Time',
+                        'value': '`2024-12-12T17:04:32.489Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Operation',
+                        'value': '`OBJECT_DELETE`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Failure Reason',
+                        'value': '`SrcObjectNotFound`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
 snapshots['test_sns_get_slack_message_payload_snapshots message_backup.json'] = [
     {
         'attachments': [
@@ -602,6 +979,68 @@ snapshots['test_sns_get_slack_message_payload_snapshots message_guardduty_findin
     }
 ]
 
+snapshots['test_sns_get_slack_message_payload_snapshots message_s3_object_notification.json'] = [
+    {
+        'attachments': [
+            {
+                'color': 'good',
+                'fallback': 'Alarm ObjectCreated:CompleteMultipartUpload triggered',
+                'fields': [
+                    {
+                        'short': True,
+                        'title': 'Event Name',
+                        'value': '`ObjectCreated:CompleteMultipartUpload`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Event Time',
+                        'value': '`2024-12-12T14:44:56.042Z`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Region',
+                        'value': '`eu-west-1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Bucket Name',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Key',
+                        'value': '`test.png`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object URL',
+                        'value': '<https://s3.console.aws.amazon.com/s3/object/test?region=eu-west-1&prefix=test.png|Link>'
+                    },
+                    {
+                        'short': True,
+                        'title': 'Source IP Address',
+                        'value': '`1.1.1.1`'
+                    },
+                    {
+                        'short': True,
+                        'title': 'User Identity',
+                        'value': '`test`'
+                    },
+                    {
+                        'short': False,
+                        'title': 'Object Size (Bytes)',
+                        'value': '`557056`'
+                    }
+                ],
+                'text': '*New Amazon S3 Object Notification Event*'
+            }
+        ],
+        'channel': 'slack_testing_sandbox',
+        'icon_emoji': ':aws:',
+        'username': 'notify_slack_test'
+    }
+]
+
 snapshots['test_sns_get_slack_message_payload_snapshots message_text_message.json'] = [
     {
         'attachments': [